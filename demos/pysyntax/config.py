@@ -39,10 +39,10 @@ class CommentPhrase(Phrase):
 
     def tokenize(self, stream: TokenizeStream) -> Type[Token] | Callable[[int, int], Token]:
         if stream.eat_n(1) == "$":  # $anchor1
-            stream.eat_until(re.compile("\\W"))
+            stream.eat_until("\\W")
             return self.DebugAnchor
         else:
-            stream.eat_until(re.compile("\\$"))
+            stream.eat_until("\\$")
             return self.CommentContent
 
 
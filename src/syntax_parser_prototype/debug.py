@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from typing import Literal, Type, Callable
 
 from .main import phrase, streams, tokens
@@ -23,16 +22,20 @@ class _Repr(
     of parser objects (Token, NodeToken, EndToken, Stream, TokenizeStream, Phrase).
 
     It overrides and controls at runtime which function is used to represent an object—based
-    on its type and MRO—and attaches itself to the classes as a descriptor so that obj.__repr__()
-    automatically calls the appropriate formatting function.
+    on its type and MRO—and installs the registered functions as ``__repr__`` of the registered classes
+    so that obj.__repr__() directly calls the appropriate formatting function.
     """
 
+    __func_cache__: dict[type, Callable[[tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase], str]]
+    """[*internal*] resolved function per type (reset by ``cache_clear``)"""
+
     def __init__(self):
         super().__init__()
+        self.__func_cache__ = dict()
 
         def __set_root__(t, f):
             super(_Repr, self).__setitem__(t, {t: f})
-            t.__repr__ = self
+            self.__install__(t, f)
 
         __set_root__(tokens.Token, self.Token__repr__)
         __set_root__(streams.Stream, self.Sream__repr__)
@@ -43,13 +46,34 @@ class _Repr(
             self[tokens.NodeToken] = self.NodeToken__repr__simple
 
     def Token__repr__(self, t: tokens.Token):
-        return f'<{t.id} coord="{t.row_no} {t.column_start}:{t.column_end}">{t.content}</{t.id}>'
+        tid = t.id
+        return f'<{tid} coord="{t.row_no} {t.column_start}:{t.column_end}">{t.content}</{tid}>'
 
     def NodeToken__repr__recursive(self, n: tokens.NodeToken):
-        return f'<{n.id} phrase="{str(n.phrase.id)}" coord="{n.row_no} {n.column_start}:{n.column_end}">{n.content}{str().join(repr(i) for i in n.inner)}{repr(n.end)}</{n.id}>'
+        # walks the branch iteratively; inner nodes that are also represented
+        # by this function are expanded in place instead of by a recursive repr
+        recursive = self.NodeToken__repr__recursive
+        parts = list()
+        stack = list()
+        node = n
+        while node is not None:
+            parts.append(f'<{node.id} phrase="{node.phrase.id!s}" coord="{node.row_no} {node.column_start}:{node.column_end}">{node.content}')
+            stack.append((node, iter(node.inner)))
+            node = None
+            while stack and node is None:
+                for t in stack[-1][1]:
+                    if t.__fNODE__ and self._get_func(type(t)) == recursive:
+                        node = t
+                        break
+                    parts.append(repr(t))
+                else:
+                    closed = stack.pop()[0]
+                    parts.append(f'{closed.end!r}</{closed.id}>')
+        return str().join(parts)
 
     def NodeToken__repr__simple(self, n: tokens.NodeToken):
-        return f'<{n.id} phrase="{str(n.phrase.id)}" coord="{n.row_no} {n.column_start}:{n.column_end}">{n.content}</{n.id}>'
+        nid = n.id
+        return f'<{nid} phrase="{n.phrase.id!s}" coord="{n.row_no} {n.column_start}:{n.column_end}">{n.content}</{nid}>'
 
     def Sream__repr__(self, s: streams.Stream):
         return f'<{s.__class__.__name__} row_no={s.row_no} viewpoint={s.viewpoint}>'
@@ -63,37 +87,44 @@ class _Repr(
     def TokenReader__repr__(self, tr: readers.TokenReader):
         return f'<{tr.__class__.__name__}(reverse={tr.__reverse__}) @ {tr.__token__!r}>'
 
-    def __hash__(self):
-        return id(self)
-
-    @lru_cache
     def _get_root(self, t: Type[tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase]):
-        for k in self:
-            if issubclass(t, k):
+        for k in t.__mro__:
+            # the mro is ordered from the type itself to its bases,
+            # the first registered type is the most specific root
+            if k in self:
                 return super().__getitem__(k)
         raise KeyError(t)
 
-    @lru_cache
     def _get_func(self, t: Type[tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase]) -> Callable[[tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase], str]:
-        cache = self._get_root(t)
-        for c in (t.mro()  # type: ignore (parameter self unfilled)
-                  [:-1]):  # exclude <object>
-            if f := cache.get(c):
-                return f
-        return t.__repr__  # type: ignore (parameter self unfilled)
+        if (f := self.__func_cache__.get(t)) is None:
+            cache = self._get_root(t)
+            for c in t.__mro__[:-1]:  # exclude <object>
+                if f := cache.get(c):
+                    break
+            else:
+                f = t.__repr__  # type: ignore (parameter self unfilled)
+            self.__func_cache__[t] = f
+        return f
 
     def __getitem__(self, t: Type[tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase]) -> Callable[[tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase], str]:
         return self._get_func(t)
 
-    def __get__(self, instance, owner):
-        self.__instance__ = instance
-        return self
-
-    def __call__(self, o: tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase = None):
-        if o is None:
-            o = self.__instance__
+    def __call__(self, o: tokens.Token | streams.Stream | streams.TokenizeStream | phrase.Phrase):
         return self._get_func(type(o))(o)
 
+    @staticmethod
+    def __install__(t, f):
+        """[*internal*] install `f` as ``__repr__`` of `t` (or remove the installed one if `f` is None);
+        the dispatching for subtypes that are not registered is then done by the regular attribute lookup."""
+        if f is None:
+            if "__repr__" in t.__dict__:
+                del t.__repr__
+        else:
+            def __repr__(o):
+                return f(o)
+
+            t.__repr__ = __repr__
+
     __incontext__: bool = False
 
     def __setitem__(self, t, f):
@@ -104,14 +135,14 @@ class _Repr(
                                "...     debug.__repr__[NodeToken] = debug.__repr__[Token]")
         cache = self._get_root(t)
         cache[t] = f
-        t.__repr__ = self
+        self.__install__(t, f)
 
     def __enter__(self):
         self.__incontext__ = True
         return self
 
     def cache_clear(self):
-        self._get_func.cache_clear()
+        self.__func_cache__.clear()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.__incontext__ = False
@@ -134,17 +165,53 @@ ex.::
 def pretty_xml(branch: tokens.NodeToken | tokens.EOF, indent: str | None = "\t", newline: str | None = "\n") -> str:
     """Converts the representation of a branch into a formatted,
     pretty-printed XML string for better readability.
+
+    (The layout corresponds to ``xml.dom.minidom.parseString(repr(branch)).toprettyxml(indent, newline)``
+    with the recursive NodeToken repr, but is emitted directly by an iterative walk over the branch)
     """
-    _default_repr = __repr__[tokens.NodeToken]
-    with __repr__:
-        __repr__[tokens.NodeToken] = __repr__.NodeToken__repr__recursive
-    try:
-        string = repr(branch)
-    finally:
-        with __repr__:
-            __repr__[tokens.NodeToken] = _default_repr
-    import xml.dom.minidom
-    return xml.dom.minidom.parseString(string).toprettyxml(indent=indent or "", newl=newline or "")
+    indent = indent or ""
+    newline = newline or ""
+    out = ['<?xml version="1.0" ?>', newline]
+    if not branch.__fNODE__:
+        _xml_leaf(out, branch, "", newline)
+        return str().join(out)
+    # indents per depth
+    ind = [""]
+    stack = list()
+    node = branch
+    while node is not None:
+        depth = len(stack)
+        if len(ind) < depth + 2:
+            ind.append(ind[-1] + indent)
+        out.append(f'{ind[depth]}<{node.id} phrase="{_xml_escape(str(node.phrase.id))}" coord="{node.row_no} {node.column_start}:{node.column_end}">{newline}')
+        if content := node.content:
+            out.append(f'{ind[depth + 1]}{_xml_escape(content)}{newline}')
+        stack.append((node, iter(node.inner)))
+        node = None
+        while stack and node is None:
+            for t in stack[-1][1]:
+                if t.__fNODE__:
+                    node = t
+                    break
+                _xml_leaf(out, t, ind[len(stack)], newline)
+            else:
+                closed = stack.pop()[0]
+                depth = len(stack)
+                _xml_leaf(out, closed.end, ind[depth + 1], newline)
+                out.append(f"{ind[depth]}</{closed.id}>{newline}")
+    return str().join(out)
+
+
+def _xml_escape(data: str) -> str:
+    return data.replace("&", "&amp;").replace("<", "&lt;").replace("\"", "&quot;").replace(">", "&gt;")
+
+
+def _xml_leaf(out: list[str], t: tokens.Token, ind: str, newline: str):
+    tid = t.id
+    if content := t.content:
+        out.append(f'{ind}<{tid} coord="{t.row_no} {t.column_start}:{t.column_end}">{_xml_escape(content)}</{tid}>{newline}')
+    else:
+        out.append(f'{ind}<{tid} coord="{t.row_no} {t.column_start}:{t.column_end}"/>{newline}')
 
 
 class _html_server:
@@ -164,6 +231,20 @@ class _html_server:
         tokens.Token: '',
     }
 
+    __style__: tuple[tuple, str] | None = None
+    """[*internal*] compiled style element and the configuration it was compiled from"""
+
+    @property
+    def style(self) -> str:
+        """style element compiled from ``main_css`` and ``token_css`` (recompiled only when they change)"""
+        config = (self.main_css, *self.token_css.items())
+        if self.__style__ is None or self.__style__[0] != config:
+            self.__style__ = (config, '<style>' + self.main_css + str().join(f'.{t.id} {{{c}}}' for t, c in self.token_css.items()) + '</style>')
+        return self.__style__[1]
+
+    __dash__: tuple | None = None
+    """[*internal*] dash objects (Dash, html, Input), imported with the first call"""
+
     click_bubble_timeout = 0.2
     clicked = list()
     
@@ -192,11 +273,14 @@ class _html_server:
             branch: tokens.NodeToken | tokens.EOF,
             at_console: bool = None,
     ):
-        from dash import Dash, html, Input
+        if self.__dash__ is None:
+            from dash import Dash, html, Input
+            self.__dash__ = (Dash, html, Input)
+        Dash, html, Input = self.__dash__
         from threading import Thread
         from time import perf_counter
 
-        _style = ('<style>' + self.main_css + str().join(f'.{t.id} {{{c}}}' for t, c in self.token_css.items()) + '</style>')
+        _style = self.style
 
         app = Dash(__name__)
 
@@ -228,8 +312,11 @@ class _html_server:
 
             run = lambda: app.run(debug=True)
 
+        _classes: dict[type, str] = dict()
+
         for token in branch.tokenReader.branch:
-            classes = " ".join(t.id for t in reversed(type(token).mro()[:-1]) if issubclass(t, (tokens.Token, phrase.Phrase, phrase.Root)))  # -1: object
+            if (classes := _classes.get(tt := type(token))) is None:
+                classes = _classes[tt] = " ".join(t.id for t in reversed(tt.__mro__[:-1]) if issubclass(t, (tokens.Token, phrase.Phrase, phrase.Root)))  # -1: object
             if token.__fNODE__:
                 s = html.Span(className=str(token.phrase.id) + " " + classes, children=[token.content])
                 trace[-1].children.append(s)
@@ -324,27 +411,31 @@ def structure_graph_app(
 
     cyto.load_extra_layouts()
 
+    from collections import deque
+
     touched = {root}
     elements = [{'data': {'id': str(root.id), 'label': str(root.id)}, "classes": "red"}]
 
-    def f(phrase):
-        if phrase not in touched:
+    elements.extend([{'data': {"id": f"{root.id}\u2007{p.id}", 'source': root.id, 'target': f'{p.id}'}, "classes": "sub"}
+                     for p in root.__sub_phrases__])
+
+    # collect all reachable phrases breadth-first (cyclic configurations are common)
+    phrases = list()
+    queue = deque(root.__sub_phrases__)
+    while queue:
+        if (phrase := queue.popleft()) not in touched:
             touched.add(phrase)
-            p_id = f'{phrase.id}'
-            elements.append({'data': {'id': p_id, 'label': p_id}})
-            for sub_phrase in phrase.__sub_phrases__:
-                sp_id = f'{sub_phrase.id}'
-                elements.append({'data': {'id': f"{p_id}\u2007{sp_id}", 'source': p_id, 'target': sp_id}, "classes": "sub"})
-                f(sub_phrase)
-            for suffix_phrase in phrase.__suffix_phrases__:
-                sp_id = f'{suffix_phrase.id}'
-                elements.append({'data': {'id': f"{p_id}\u2007{sp_id}", 'source': p_id, 'target': sp_id}, "classes": "suffix"})
-                f(suffix_phrase)
-
-    for p in root.__sub_phrases__:
-        sp_id = f'{p.id}'
-        elements.append({'data': {"id": f"{root.id}\u2007{sp_id}", 'source': root.id, 'target': sp_id}, "classes": "sub"})
-        f(p)
+            phrases.append(phrase)
+            queue.extend(phrase.__sub_phrases__)
+            queue.extend(phrase.__suffix_phrases__)
+
+    for phrase in phrases:
+        p_id = f'{phrase.id}'
+        elements.append({'data': {'id': p_id, 'label': p_id}})
+        elements.extend([{'data': {'id': f"{p_id}\u2007{sp.id}", 'source': p_id, 'target': f'{sp.id}'}, "classes": "sub"}
+                         for sp in phrase.__sub_phrases__])
+        elements.extend([{'data': {'id': f"{p_id}\u2007{sp.id}", 'source': p_id, 'target': f'{sp.id}'}, "classes": "suffix"}
+                         for sp in phrase.__suffix_phrases__])
 
     app = dash.Dash(__name__)
 
@@ -15,6 +15,7 @@ Classes:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import TYPE_CHECKING
 
 from xpropcache import PropCache
@@ -39,6 +40,10 @@ class TokenIndex:
 
     **(see module docstring)**"""
 
+    __data_starts__: dict[tokens.T_RESULT_TOKEN, int] | None = None
+    """[*internal*] starting points of all tokens,
+    filled with a single pass on the first request after the parsing process (None during the process)"""
+
     def __at_row__(self, p: streams.Parser):
         # register last node before current row
         ...
@@ -49,13 +54,26 @@ class TokenIndex:
 
     def __build__(self):
         # finalize index
-        ...
+        self.__data_starts__ = dict()
 
     def __char_cache_reset__(self, from_i: int = 0):
         ...
 
+    def __data_cache_reset__(self):
+        # content length of a token changed (with or without reindexing)
+        if self.__data_starts__:
+            self.__data_starts__ = dict()
+
     def data_start_of(self, token: tokens.T_BASE_TOKENS) -> int:
         """starting point of the token relative to the whole data"""
+        if (data_starts := self.__data_starts__) is not None:
+            if not data_starts:
+                cursor = 0
+                for t in token.node.root.tokenReader.branch:
+                    data_starts[t] = cursor
+                    cursor += t.len_token
+            if (start := data_starts.get(token)) is not None:
+                return start
         return sum(t.len_token for t in token.tokenReader.therebefore)
 
 
@@ -99,12 +117,14 @@ class ExtensiveTokenIndex(TokenIndex):
         @PropCache.cached_property
         def row_tokens(self) -> list[tokens.T_BASE_TOKENS]:
             """all tokens in the row"""
-            tokens = [self.first_token]
+            row_no = self.row_no
+            row_tokens = [self.first_token]
+            append = row_tokens.append
             for token in self.first_token.tokenReader.thereafter:
-                if token.row_no != self.row_no:
+                if token.row_no != row_no:
                     break
-                tokens.append(token)
-            return tokens
+                append(token)
+            return row_tokens
 
         first_token: tokens.T_BASE_TOKENS
         """first token in the row"""
@@ -118,7 +138,14 @@ class ExtensiveTokenIndex(TokenIndex):
         def data_start(self) -> int:
             """starting point of the row relative to the whole data"""
             if self.row_no:
-                return self.__idx__[self.row_no - 1].data_end
+                # running sum from the last cached row instead of a recursion over all previous rows
+                records = self.__idx__.__stack__
+                i = self.row_no - 1
+                while i and "data_end" not in records[i].__dict__:
+                    i -= 1
+                for record in records[i:self.row_no - 1]:
+                    record.data_end  # noqa: cache in row order
+                return records[self.row_no - 1].data_end
             else:
                 return self.first_token.column_start
 
@@ -132,16 +159,22 @@ class ExtensiveTokenIndex(TokenIndex):
             """length of the row content"""
             return self.last_token.column_end
 
+        @PropCache.cached_property(_CacheKeys.CHARCOUNT)
+        def column_ends(self) -> list[int]:
+            """``column_end`` of all tokens in the row"""
+            return [token.column_end for token in self.row_tokens]
+
         def token_at(self, col_no: int) -> tokens.T_RESULT_TOKEN | None:
             """returns the token at the given column"""
-            for token in self.row_tokens:
-                if token.column_end > col_no:
-                    return token
+            if (i := bisect_right(self.column_ends, col_no)) < len(self.row_tokens):
+                return self.row_tokens[i]
             else:
                 return None
 
     __temp__: list[tokens.T_BASE_TOKENS]
     __stack__: list[Record]
+    __data_ends__: list[int]
+    """[*internal*] ``data_end`` of the records (filled on demand in row order)"""
 
     def __init__(self):
         self.__temp__ = list()
@@ -175,6 +208,7 @@ class ExtensiveTokenIndex(TokenIndex):
                         break
             self.__stack__.append(self.Record(token, self))
         del self.__temp__
+        self.__data_ends__ = list()
 
     def __getitem__(self, row_no: int) -> Record:
         return self.__stack__[row_no]
@@ -182,6 +216,7 @@ class ExtensiveTokenIndex(TokenIndex):
     def __char_cache_reset__(self, from_i: int = 0):
         for record in self.__stack__[from_i:]:
             PropCache.cp_reset_by_flag(record, _CacheKeys.CHARCOUNT)
+        del self.__data_ends__[from_i:]
 
     def data_start_of(self, token: tokens.T_BASE_TOKENS) -> int:
         """starting point of the token relative to the whole data"""
@@ -193,8 +228,14 @@ class ExtensiveTokenIndex(TokenIndex):
 
     def get_token_at_cursor(self, cursor: int) -> tokens.T_RESULT_TOKEN | None:
         """returns the token at the given data cursor (relative to the whole data)"""
-        for record in self.__stack__:
-            if record.data_end > cursor:
-                return record.token_at(cursor - record.data_start)
+        data_ends = self.__data_ends__
+        if not data_ends or data_ends[-1] <= cursor:
+            for record in self.__stack__[len(data_ends):]:
+                data_ends.append(record.data_end)
+                if record.data_end > cursor:
+                    break
+        if (i := bisect_right(data_ends, cursor)) < len(data_ends):
+            record = self.__stack__[i]
+            return record.token_at(cursor - record.data_start)
         else:
             return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import islice
 from typing import TYPE_CHECKING, Generator, Any, Reversible, Callable, Literal
 
 if TYPE_CHECKING:
@@ -35,16 +36,36 @@ class TokenReader(__TokenReversible__):
         - ``therebefore``: from the beginning of the data to before the anchor token (excl. anchor)
     """
     
+    __slots__ = ("__token__", "__fgen__", "__rgen__", "__context__", "__reverse__", "__content__", "__pool__")
+
     __token__: tokens.Token
     __fgen__: Callable[[], Generator[tokens.Token, Any, None]]
     __rgen__: Callable[[], Generator[tokens.Token, Any, None]]
     __context__: Literal["thereafter", "therebefore"]
     __reverse__: bool
 
+    __content__: tuple[int, str] | None
+    """[*internal*] cached content with the result version it was created from"""
+
+    __pool__: dict[tuple[str, bool], TokenReader]
+    """[*internal*] readers of the anchor by (context, reverse), shared by all readers of the anchor"""
+
     @property
     def content(self) -> str:
         """returns the content of the tokens in the reader's context as a string"""
-        return "".join(i.content for i in self)
+        version = self.__token__.node.root.__version__
+        if (cache := self.__content__) is not None and cache[0] == version:
+            return cache[1]
+        if self.__context__ == "node_path":
+            # short chain (depth of the anchor), in-place concatenation without an intermediate list
+            content = ""
+            for i in self:
+                content += i.content
+        else:
+            content = "".join([i.content for i in self])
+        if version is not None:
+            self.__content__ = (version, content)
+        return content
     
     def __init__(
             self,
@@ -53,12 +74,32 @@ class TokenReader(__TokenReversible__):
             __rgen__: Callable[[], Generator[tokens.Token, Any, None]],
             __context__: Literal["thereafter", "therebefore"],
             __reverse__: bool,
+            __pool__: dict[tuple[str, bool], TokenReader] | None = None,
     ):
         self.__token__ = __token__
         self.__fgen__ = __fgen__
         self.__rgen__ = __rgen__
         self.__context__ = __context__
         self.__reverse__ = __reverse__
+        self.__content__ = None
+        if __pool__ is None:
+            __pool__ = dict()
+        self.__pool__ = __pool__
+        __pool__.setdefault((__context__, __reverse__), self)
+
+    def __derive__(
+            self,
+            __fgen__: Callable[[], Generator[tokens.Token, Any, None]],
+            __rgen__: Callable[[], Generator[tokens.Token, Any, None]],
+            __context__: Literal["thereafter", "therebefore", "inner", "branch", "node_path"],
+            __reverse__: bool,
+    ) -> Self:
+        """[*internal*] returns the reader of the anchor for the context from the pool or creates it
+        (readers are stateless, so one instance per context and direction can be shared)"""
+        try:
+            return self.__pool__[(__context__, __reverse__)]
+        except KeyError:
+            return self.__class__(self.__token__, __fgen__, __rgen__, __context__, __reverse__, self.__pool__)  # type: ignore
 
     @classmethod
     def __default__(cls, token: tokens.Token) -> Self:
@@ -70,22 +111,15 @@ class TokenReader(__TokenReversible__):
             False
         )
 
-    def __next__(self) -> tokens.Token:
-        return next(self.__gen__)
-
-    __gen__: Generator[tokens.Token, Any, None]
-
-    def __iter__(self) -> Self:
-        self.__token__.__generators__.__instance__ = self.__token__
+    def __iter__(self) -> Generator[tokens.Token, Any, None]:
+        """returns a new generator for each iteration (the reader itself is not an iterator)"""
         if self.__reverse__:
-            self.__gen__ = self.__rgen__()
+            return self.__rgen__()
         else:
-            self.__gen__ = self.__fgen__()
-        return self
+            return self.__fgen__()
     
     def __reversed__(self) -> Self:
-        return self.__class__(
-            self.__token__,
+        return self.__derive__(
             self.__fgen__,
             self.__rgen__,
             self.__context__,
@@ -93,8 +127,7 @@ class TokenReader(__TokenReversible__):
         )
     
     def __call__(self, reverse: bool = False) -> Self:
-        return self.__class__(
-            self.__token__,
+        return self.__derive__(
             self.__fgen__,
             self.__rgen__,
             self.__context__,
@@ -103,14 +136,18 @@ class TokenReader(__TokenReversible__):
 
     @property
     def thereafter(self) -> Self:
-        """returns a new reader that iterates from after the anchor to the end of data (excl. anchor)"""
-        return self.__default__(self.__token__)
+        """returns a reader that iterates from after the anchor to the end of data (excl. anchor)"""
+        return self.__derive__(
+            self.__token__.__generators__.__thereafter__,
+            self.__token__.__generators__.__r_thereafter__,
+            "thereafter",
+            False
+        )
 
     @property
     def therebefore(self) -> Self:
-        """returns a new reader that iterates from the beginning of the data to before the anchor token (excl. anchor)"""
-        return self.__class__(
-            self.__token__,
+        """returns a reader that iterates from the beginning of the data to before the anchor token (excl. anchor)"""
+        return self.__derive__(
             self.__token__.__generators__.__therebefore__,
             self.__token__.__generators__.__r_therebefore__,
             "therebefore",
@@ -133,14 +170,15 @@ class NodeTokenReader(TokenReader):
         - ``branch``: from the beginning of the inner tokens to the end of the inner tokens, recursively for sub-nodes (incl. node and end token at anchor's level).
         - ``node_path``: structure path from the root node to the anchor node (incl.).
     """
+    __slots__ = ()
+
     __token__: tokens.NodeToken
     __context__: Literal["thereafter", "therebefore", "inner", "branch", "node_path"]
 
     @property
     def node_path(self) -> Self:
-        """returns a new reader that iterates through the structure path from the root node to the anchor node (incl.)"""
-        return self.__class__(
-            self.__token__,
+        """returns a reader that iterates through the structure path from the root node to the anchor node (incl.)"""
+        return self.__derive__(
             self.__token__.__generators__.__node_path__,
             self.__token__.__generators__.__r_node_path__,
             "node_path",  # type: ignore
@@ -149,9 +187,8 @@ class NodeTokenReader(TokenReader):
 
     @property
     def inner(self) -> Self:
-        """returns a new reader that iterates from the beginning of the inner tokens to the end of the inner tokens, recursively for sub-nodes (excl. node and end token at anchor's level)"""
-        return self.__class__(
-            self.__token__,
+        """returns a reader that iterates from the beginning of the inner tokens to the end of the inner tokens, recursively for sub-nodes (excl. node and end token at anchor's level)"""
+        return self.__derive__(
             self.__token__.__generators__.__inner__,
             self.__token__.__generators__.__r_inner__,
             "inner",  # type: ignore
@@ -160,9 +197,8 @@ class NodeTokenReader(TokenReader):
 
     @property
     def branch(self) -> Self:
-        """returns a new reader that iterates from the beginning of the inner tokens to the end of the inner tokens, recursively for sub-nodes (incl. node and end token at anchor's level)"""
-        return self.__class__(
-            self.__token__,
+        """returns a reader that iterates from the beginning of the inner tokens to the end of the inner tokens, recursively for sub-nodes (incl. node and end token at anchor's level)"""
+        return self.__derive__(
             self.__token__.__generators__.__branch__,
             self.__token__.__generators__.__r_branch__,
             "branch",  # type: ignore
@@ -171,11 +207,18 @@ class NodeTokenReader(TokenReader):
 
 
 class __TokenGenerators__:
-    __instance__: tokens.Token
+    __slots__ = ("__instance__",)
 
-    def __get__(self, instance, owner) -> Self:
+    __instance__: tokens.Token | None
+
+    def __init__(self, instance: tokens.Token | None = None):
         self.__instance__ = instance
-        return self
+
+    def __get__(self, instance, owner) -> Self:
+        # bound to the accessing token (no shared state between the generators of different tokens)
+        if instance is None:
+            return self
+        return self.__class__(instance)
 
     def __thereafter__(self):
         __inst__ = self.__instance__
@@ -226,6 +269,7 @@ class __TokenGenerators__:
 
 
 class ___EdgeTokenGenerators__(__TokenGenerators__):
+    __slots__ = ()
 
     def __thereafter__(self):
         __inst__ = self.__instance__.next
@@ -249,39 +293,75 @@ class ___EdgeTokenGenerators__(__TokenGenerators__):
 
 
 class __NodeTokenGenerators__(___EdgeTokenGenerators__):
+    __slots__ = ()
+
     __instance__: tokens.NodeToken
 
     def __r_node_path__(self):
-        __inst__ = self.__instance__
-        yield __inst__
-        yield from __inst__.node.__generators__.__r_node_path__()
+        # iterative walk up to the root (the root is its own node)
+        node = self.__instance__
+        yield node
+        while (parent := node.node) is not node:
+            yield parent
+            node = parent
 
     def __node_path__(self):
-        __inst__ = self.__instance__
-        yield from __inst__.node.__generators__.__node_path__()
-        yield __inst__
+        node = self.__instance__
+        path = [node]
+        while (parent := node.node) is not node:
+            path.append(parent)
+            node = parent
+        yield from reversed(path)
 
     def __inner__(self) -> Generator[tokens.NodeToken | tokens.EndToken | tokens.OpenEndToken | tokens.Token, Any, None]:
         """generate inner tokens recursively"""
         __inst__ = self.__instance__
-        for t in __inst__.inner:
-            if t.__fNODE__:
+        if not __inst__.__inner_nodes__:
+            yield from __inst__.inner
+            return
+        # iterative depth-first walk (no generator frame per sub-node)
+        stack = [iter(__inst__.inner)]
+        ends = []
+        while stack:
+            for t in stack[-1]:
                 yield t
-                yield from t.__generators__.__inner__()
-                yield t.end
+                if t.__fNODE__:
+                    if t.__inner_nodes__:
+                        stack.append(iter(t.inner))
+                        ends.append(t.end)
+                        break
+                    yield from t.inner
+                    yield t.end
             else:
-                yield t
+                stack.pop()
+                if ends:
+                    yield ends.pop()
 
     def __r_inner__(self) -> Generator[tokens.NodeToken | tokens.EndToken | tokens.OpenEndToken | tokens.Token, Any, None]:
         """generate inner tokens recursively"""
         __inst__ = self.__instance__
-        for t in reversed(__inst__.inner):
-            if t.__fNODE__:
-                yield t.end
-                yield from t.__generators__.__r_inner__()
-                yield t
+        if not __inst__.__inner_nodes__:
+            yield from reversed(__inst__.inner)
+            return
+        # iterative depth-first walk (no generator frame per sub-node)
+        stack = [reversed(__inst__.inner)]
+        nodes = []
+        while stack:
+            for t in stack[-1]:
+                if t.__fNODE__:
+                    yield t.end
+                    if t.__inner_nodes__:
+                        stack.append(reversed(t.inner))
+                        nodes.append(t)
+                        break
+                    yield from reversed(t.inner)
+                    yield t
+                else:
+                    yield t
             else:
-                yield t
+                stack.pop()
+                if nodes:
+                    yield nodes.pop()
 
     def __branch__(self) -> Generator[tokens.NodeToken | tokens.EndToken | tokens.OpenEndToken | tokens.Token, Any, None]:
         """generate inner tokens recursively with this and this end"""
@@ -299,7 +379,8 @@ class __NodeTokenGenerators__(___EdgeTokenGenerators__):
 
     def __inner_from_index__(self, i: int):
         __inst__ = self.__instance__
-        for t in __inst__.inner[i:]:
+        inner = __inst__.inner
+        for t in islice(inner, i, None):
             if t.__fNODE__:
                 yield t
                 yield from t.__generators__.__inner__()
@@ -309,7 +390,8 @@ class __NodeTokenGenerators__(___EdgeTokenGenerators__):
 
     def __r_inner_from_index__(self, i: int):
         __inst__ = self.__instance__
-        for t in reversed(__inst__.inner[i:]):
+        inner = __inst__.inner
+        for t in islice(reversed(inner), max(len(inner) - i, 0)):
             if t.__fNODE__:
                 yield t.end
                 yield from t.__generators__.__r_inner__()
@@ -319,7 +401,8 @@ class __NodeTokenGenerators__(___EdgeTokenGenerators__):
 
     def __r_inner_until_index__(self, i: int):
         __inst__ = self.__instance__
-        for t in reversed(__inst__.inner[:i]):
+        inner = __inst__.inner
+        for t in islice(reversed(inner), max(len(inner) - i, 0), None):
             if t.__fNODE__:
                 yield t.end
                 yield from t.__generators__.__r_inner__()
@@ -329,7 +412,8 @@ class __NodeTokenGenerators__(___EdgeTokenGenerators__):
 
     def __inner_until_index__(self, i: int):
         __inst__ = self.__instance__
-        for t in __inst__.inner[:i]:
+        inner = __inst__.inner
+        for t in islice(inner, i):
             if t.__fNODE__:
                 yield t
                 yield from t.__generators__.__inner__()
@@ -339,19 +423,23 @@ class __NodeTokenGenerators__(___EdgeTokenGenerators__):
 
 
 class __EndTokenGenerators__(___EdgeTokenGenerators__):
+    __slots__ = ()
+
     __instance__: tokens.EndToken
 
 
 class __OpenEndTokenGenerators__(__EndTokenGenerators__):
+    __slots__ = ()
+
     __instance__: tokens.OpenEndToken
 
     def __r_thereafter__(self):
         __inst__ = self.__instance__
-        t = __inst__.node.root.end
-        if t is not __inst__:
-            while t is not __inst__:
-                yield t
-                t = t.previous
+        # walks the inner lists of the root backwards instead of chasing ``previous``
+        for t in __inst__.node.root.__generators__.__r_branch__():
+            if t is __inst__:
+                return
+            yield t
 
     def __thereafter__(self):
         __inst__ = self.__instance__.next
@@ -361,6 +449,8 @@ class __OpenEndTokenGenerators__(__EndTokenGenerators__):
 
 
 class __EOFTokenGenerators__(__OpenEndTokenGenerators__):
+    __slots__ = ()
+
     __instance__: tokens.EOF
 
     def __r_thereafter__(self) -> None:
@@ -371,6 +461,8 @@ class __EOFTokenGenerators__(__OpenEndTokenGenerators__):
 
 
 class __RootNodeGenerators__(__NodeTokenGenerators__):
+    __slots__ = ()
+
     __instance__: tokens.RootNode
 
     def __r_node_path__(self):
@@ -31,7 +31,7 @@ Features can be linked to form a selective process, but a basic logic is followe
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Callable
 
 if TYPE_CHECKING:
     from typing import Self
@@ -57,23 +57,30 @@ __all__ = (
 
 
 class Feat:
+    __slots__ = ("__left__", "__right__", "__rval__", "__forward__", "__swtarg__", "__plan__")
 
     __left__: list[LStrip | SwitchTo]
     __right__: list[RTokenize | SwitchTo]
-    __rval__: int = 0
-    __forward__: ForwardTo = None
+    __rval__: int
+    __forward__: ForwardTo | None
 
     __swtarg__: list[LStrip | SwitchTo] | list[RTokenize | SwitchTo]
 
+    __plan__: tuple[tuple[Callable, ...], tuple[Callable, ...]] | None
+    """[*internal*] bound ``__run__`` methods of the chain (left, right + forward), built with the first call"""
+
     def __init__(self):
         self.__left__ = self.__swtarg__ = list()
         self.__right__ = list()
-        self.__or__(self)
+        self.__rval__ = 0
+        self.__forward__ = None
+        self.__plan__ = None
 
     def __or__(
             self,
             other: Union[LStrip | RTokenize | SwitchTo | ForwardTo]
     ) -> Self:
+        self.__plan__ = None
         if isinstance(other, ForwardTo):
             self.__forward__ = other
         elif isinstance(other, LStrip):
@@ -87,23 +94,30 @@ class Feat:
         return self
 
     def __call__(self, token: tokens.T_BASE_TOKENS, parser: streams.Parser):
-        parser.__carry__(token.__at__)  # carry for parsed remain
+        if (plan := self.__plan__) is None:
+            rights = [right.__run__ for right in self.__right__]
+            if self.__forward__:
+                rights.append(self.__forward__.__run__)
+            plan = self.__plan__ = (
+                tuple(left.__run__ for left in self.__left__),
+                tuple(rights),
+            )
+        lefts, rights = plan
+
+        parser.viewpoint = parser.__position__ = parser.viewpoint + token.__at__  # carry for parsed remain
 
-        for left in self.__left__:
-            left.__run__(token, parser)  # carries __at__
+        for left in lefts:
+            left(token, parser)  # carries __at__
 
         token.__to__ -= self.__rval__
 
         if token.__at__ > token.__to__:
             raise FeatureError(token, parser)
 
-        BaseFeat(token).__fun__(token, parser, token.__designated__)
+        token.__base_feat__.__fun__(token, parser, token.__designated__)
 
-        for right in self.__right__:
-            right.__run__(token, parser)  # carries parser
-
-        if self.__forward__:
-            self.__forward__.__run__(token, parser)
+        for right in rights:
+            right(token, parser)  # carries parser (the forward is the last one)
 
 
 class LStrip(Feat):
@@ -122,15 +136,18 @@ class LStrip(Feat):
         )
         # the content of this token will be "*"
     """
+    __slots__ = ("__value__",)
 
     def __init__(self, value: int):
         self.__value__ = value
         super().__init__()
+        self.__left__.append(self)
 
     def __run__(self, token: tokens.Token, parser: streams.Parser):
-        token.__at__ += self.__value__
+        value = self.__value__
+        token.__at__ += value
         token.__feat_phrase__.TTokenizeStream(parser, token, token, "<").__run__()
-        parser.__carry__(self.__value__)
+        parser.viewpoint = parser.__position__ = parser.viewpoint + value
 
 
 class RTokenize(Feat):
@@ -149,21 +166,26 @@ class RTokenize(Feat):
         )
         # the content of this token will be "*"
     """
+    __slots__ = ("__value__", "column_start")
 
     def __init__(self, value: int):
         self.__value__ = value
         super().__init__()
+        self.__right__.append(self)
+        self.__rval__ = value
+        self.__swtarg__ = self.__right__
 
     column_start: int
 
     def __run__(self, token: tokens.T_BASE_TOKENS, parser: streams.Parser):
-        self.column_start = parser.viewpoint + self.__value__
+        value = self.__value__
+        self.column_start = parser.viewpoint + value
         token.__feat_phrase__.TTokenizeStream(
             parser,
             self,
             token,
             ">").__run__()
-        parser.__carry__(self.__value__)
+        parser.viewpoint = parser.__position__ = parser.viewpoint + value
 
 
 class SwitchTo(Feat):
@@ -180,10 +202,12 @@ class SwitchTo(Feat):
     The previous phrase is lost in the process, in future the configuration
     of this phrase will be applied in the branch (``Phrase.ends``, ``Phrase.tokenize``, ...)
     """
+    __slots__ = ("__value__",)
 
     def __init__(self, value: phrase.Phrase | phrase.Root):
         self.__value__ = value
         super().__init__()
+        self.__left__.append(self)
 
     def __run__(self, token: tokens.T_BASE_TOKENS, parser: streams.Parser):
         token.__feat_phrase__ = self.__value__
@@ -201,10 +225,12 @@ class SwitchPh(Feat):
     The previous phrase is lost in the process, in future the configuration
     of this phrase will be applied in the branch (``Phrase.ends``, ``Phrase.tokenize``, ...)
     """
+    __slots__ = ("__value__",)
 
     def __init__(self, value: phrase.Phrase | phrase.Root):
         self.__value__ = value
         super().__init__()
+        self.__left__.append(self)
 
     def __run__(self, token: tokens.T_BASE_TOKENS, parser: streams.Parser):
         parser.node.phrase = self.__value__
@@ -216,14 +242,17 @@ class ForwardTo(Feat):
     Will execute ``<Phrase>.start(...)`` of the passed phrase object and change directly if positive
     (the previous phrase remains as a parent).
     """
+    __slots__ = ("__value__",)
 
     def __init__(self, value: phrase.Phrase):
         self.__value__ = value
         super().__init__()
+        self.__forward__ = self
 
     def __run__(self, token: tokens.Token, parser: streams.Parser):
-        if item := self.__value__.starts(parser):
-            item.phrase = self.__value__
+        phrase = self.__value__
+        if item := phrase.starts(parser):
+            item.phrase = phrase
             if token.__to__ == 0 and item.__to__ == 0:
                 # The source as well as the ForwardTo Token are null tokens that could create an infinite loop.
                 # If the source is an EndToken, the parser would not notice this.
@@ -234,10 +263,9 @@ class ForwardTo(Feat):
 class _BaseFeat:
 
     def __fun__(self, token: tokens.Token, parser: streams.Parser, __carry__: int):
-        token.content = parser.row[
-            token.__viewpoint__ + token.__at__:token.__viewpoint__ + token.__to__
-        ]
-        parser.__carry__(__carry__)
+        viewpoint = token.__viewpoint__
+        token.__content__ = parser.row[viewpoint + token.__at__:viewpoint + token.__to__]
+        parser.viewpoint = parser.__position__ = parser.viewpoint + __carry__
 
     def __call__(self, token: tokens.Token, parser: streams.Parser):
         self.__fun__(token, parser, token.__to__)
@@ -247,13 +275,16 @@ class _TokenBaseFeat(_BaseFeat):
 
     def __fun__(self, token: tokens.Token, parser: streams.Parser, __carry__: int):
         super().__fun__(token, parser, __carry__)
-        parser.node.inner.append(token)
+        inner = parser.node.inner
+        token.__idx__ = len(inner)
+        inner.append(token)
 
 
 class _NodeBaseFeat(_TokenBaseFeat):
 
     def __fun__(self, token: tokens.NodeToken, parser: streams.Parser, __carry__: int):
         super().__fun__(token, parser, __carry__)
+        parser.node.__inner_nodes__ = True
         parser.node = token
 
 
@@ -262,7 +293,7 @@ class _EndBaseFeat(_BaseFeat):
     def __fun__(self, token: tokens.EndToken, parser: streams.Parser, __carry__: int):
         super().__fun__(token, parser, __carry__)
         parser.node.end = token
-        parser.__suffix_phrases__ = token.node.phrase.__suffix_phrases__
+        parser.__suffix_phrases__ = token.node.phrase.__suffixes__
         # return to the parent node
         parser.node = token.node.node
 
@@ -271,14 +302,11 @@ BASE_T_FEAT = _TokenBaseFeat()
 BASE_N_FEAT = _NodeBaseFeat()
 BASE_E_FEAT = _EndBaseFeat()
 
+_BASE_FEATS = (BASE_T_FEAT, BASE_N_FEAT, BASE_E_FEAT)  # by Token.__kind__
+
 
 def BaseFeat(token: tokens.T_BASE_TOKENS):
-    if token.__fEND__:
-        return BASE_E_FEAT
-    elif token.__fNODE__:
-        return BASE_N_FEAT
-    else:
-        return BASE_T_FEAT
+    return _BASE_FEATS[token.__kind__]
 
 
 T_STD_FEATURES = Union[LStrip, RTokenize, SwitchTo, ForwardTo]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import overload, TYPE_CHECKING, Type, final, Iterable, Any, Callable
+import re
+from typing import overload, TYPE_CHECKING, Type, final, Iterable, Any, Callable, Pattern
 
 if TYPE_CHECKING:
     from typing import Self
@@ -15,6 +16,21 @@ __all__ = (
 )
 
 
+def _trigger(phrase: Phrase | type[Phrase]) -> Pattern[str] | None:
+    """compiled ``literal_trigger`` or ``trigger`` of a phrase class or instance"""
+    if phrase.literal_trigger is not None:
+        return re.compile(re.escape(phrase.literal_trigger))
+    elif isinstance(phrase.trigger, str):
+        return re.compile(phrase.trigger)
+    else:
+        return phrase.trigger
+
+
+def _init_keys(cls: type) -> frozenset[str]:
+    """keyword arguments accepted by ``__init__``: the annotations visible to the instances of ``cls``"""
+    return frozenset(next(c.__dict__["__annotations__"] for c in cls.__mro__ if "__annotations__" in c.__dict__))
+
+
 class Phrase:
     """Represents a phrase entity providing interfaces for tokenization, node detection,
     and managing relationships with other phrases.
@@ -27,6 +43,9 @@ class Phrase:
         If ``start`` returns a ``MaskToken``, sub-/suffix-phrases are **NOT** evaluated.
     """
 
+    # ``__dict__`` stays available for the entry attributes (class level overrides, keyword arguments)
+    __slots__ = ("__dict__", "__sub_phrases__", "__suffix_phrases__", "__subs__", "__suffixes__", "__shared__")
+
     id: Any
     """[*ENTRY*] phrase id (memory loc id if not defined in derivatives) (default usage: only for debugging)"""
     TDefaultToken: Type[tokens.Token] | Callable[..., tokens.Token] = tokens.Token
@@ -37,32 +56,82 @@ class Phrase:
     """[*ENTRY*] tokenize stream class"""
     TDefaultTokenizeStream: Type[streams.DefaultTokenizeStream] | Callable[..., streams.DefaultTokenizeStream] = streams.DefaultTokenizeStream
     """[*ENTRY*] non-tokenize stream class (if tokenize is not defined)"""
+    trigger: Pattern[str] | str | None = None
+    """[*ENTRY*] optional prefilter for ``starts``: a pattern (or pattern string) that must be found in
+    ``stream.unparsed`` for ``starts`` to return a token, otherwise the query is skipped.
+    The position of the next occurrence is remembered per row, so the pattern should not depend
+    on the preceding content (no anchors or lookbehinds)."""
+    literal_trigger: str | None = None
+    """[*ENTRY*] optional prefilter for ``starts`` as plain string (replaces ``trigger``)"""
+
+    __trigger__: Pattern[str] | None = None
+    """[*internal*] compiled trigger (evaluated once per class, or per instance if passed as keyword argument)"""
 
     __sub_phrases__: set[Phrase]
     __suffix_phrases__: set[Phrase]
+    __subs__: tuple[Phrase, ...]
+    """[*internal*] snapshot of the sub-phrases iterated by the parser"""
+    __suffixes__: tuple[Phrase, ...]
+    """[*internal*] snapshot of the suffix-phrases iterated by the parser"""
+    __shared__: bool
+    """[*internal*] whether the sets may be shared with a clone (see ``__call__``)"""
+
+    __default_tokenize__: bool = True
+    """[*internal*] whether ``tokenize`` is not defined by the class (evaluated once per class)"""
+
+    __init_keys__: frozenset[str]
+    """[*internal*] keyword arguments accepted by ``__init__`` (evaluated once per class)"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__default_tokenize__ = cls.tokenize is Phrase.tokenize
+        cls.__init_keys__ = _init_keys(cls)
+        cls.__trigger__ = _trigger(cls)
 
     def __init__(self, *args, **kwargs):
-        for attr in self.__annotations__:
-            if attr in kwargs:
-                setattr(self, attr, kwargs.pop(attr))
+        if kwargs:
+            init_keys = self.__init_keys__
+            for attr, value in kwargs.items():
+                if attr in init_keys:
+                    setattr(self, attr, value)
+            if "trigger" in kwargs or "literal_trigger" in kwargs:
+                self.__trigger__ = _trigger(self)
         if not hasattr(self, "id"):
             self.id = id(self)
-        if self.__class__.tokenize is Phrase.tokenize:
+        if self.__default_tokenize__:
             # saves some operations in the parsing process
             # if tokenize has not been defined
             self.TTokenizeStream = self.TDefaultTokenizeStream
         self.__sub_phrases__ = set()
         self.__suffix_phrases__ = set()
+        self.__subs__ = self.__suffixes__ = ()
+        self.__shared__ = False
 
     def __call__(self, *args, **kwargs):
         """Creates a new instance of the class and copies the phrase configurations.
         Allows dynamic phrase definition during the parsing process.
         """
         new = self.__class__(**kwargs)
-        new.__sub_phrases__ = self.__sub_phrases__.copy()
-        new.__suffix_phrases__ = self.__suffix_phrases__.copy()
+        # the sets are shared until one of the two is modified (copy on write)
+        new.__sub_phrases__ = self.__sub_phrases__
+        new.__suffix_phrases__ = self.__suffix_phrases__
+        new.__subs__ = self.__subs__
+        new.__suffixes__ = self.__suffixes__
+        new.__shared__ = self.__shared__ = True
         return new
 
+    def __own__(self) -> None:
+        """[*internal*] copy the sub- and suffix-phrase sets before a modification if they are shared with a clone"""
+        if self.__shared__:
+            self.__sub_phrases__ = self.__sub_phrases__.copy()
+            self.__suffix_phrases__ = self.__suffix_phrases__.copy()
+            self.__shared__ = False
+
+    def __freeze__(self) -> None:
+        """[*internal*] update the snapshots of the sub- and suffix-phrases after a modification"""
+        self.__subs__ = tuple(self.__sub_phrases__)
+        self.__suffixes__ = tuple(self.__suffix_phrases__)
+
     def starts(self, stream: streams.Stream) -> (
             None
             | tokens.NodeToken
@@ -97,7 +166,7 @@ class Phrase:
             except ValueError:
                 return None
         """
-        return tokens.NodeToken(0, len(stream.unparsed))
+        return tokens.NodeToken(0, stream.__len_row__ - stream.viewpoint)
 
     def tokenize(
             self,
@@ -169,28 +238,17 @@ class Phrase:
         **Note**
             If ``start`` returns a ``MaskToken``, sub-/suffix-phrases are **NOT** evaluated.
         """
-        if mutual:
-            def _i():
-                nonlocal node
-                if isinstance(node, Phrase):
-                    self.__sub_phrases__.add(node)
-                    node.__sub_phrases__.add(self)
-                else:
-                    for _node in node:
-                        self.__sub_phrases__.add(_node)
-                        _node.__sub_phrases__.add(self)
-        else:
-            def _i():
-                nonlocal node
-                if isinstance(node, Phrase):
-                    self.__sub_phrases__.add(node)
-                else:
-                    for _node in node:
-                        self.__sub_phrases__.add(_node)
-
+        Phrase.__own__(self)
+        sub_phrases = self.__sub_phrases__
         for node in nodes:
-            _i()
-
+            for _node in (node,) if isinstance(node, Phrase) else node:
+                sub_phrases.add(_node)
+                if mutual:
+                    _node.__own__()
+                    _node.__sub_phrases__.add(self)
+                    _node.__freeze__()
+
+        Phrase.__freeze__(self)
         return self
 
     @overload
@@ -207,28 +265,17 @@ class Phrase:
 
         When collections are passed as iterables of phrase objects, they are unpacked internally.
         """
-        if mutual:
-            def _i():
-                nonlocal node
-                if isinstance(node, Phrase):
-                    self.__sub_phrases__.discard(node)
-                    node.__sub_phrases__.discard(self)
-                else:
-                    for _node in node:
-                        self.__sub_phrases__.discard(_node)
-                        _node.__sub_phrases__.discard(self)
-        else:
-            def _i():
-                nonlocal node
-                if isinstance(node, Phrase):
-                    self.__sub_phrases__.discard(node)
-                else:
-                    for _node in node:
-                        self.__sub_phrases__.discard(_node)
-
+        Phrase.__own__(self)
+        sub_phrases = self.__sub_phrases__
         for node in nodes:
-            _i()
-
+            for _node in (node,) if isinstance(node, Phrase) else node:
+                sub_phrases.discard(_node)
+                if mutual:
+                    _node.__own__()
+                    _node.__sub_phrases__.discard(self)
+                    _node.__freeze__()
+
+        Phrase.__freeze__(self)
         return self
 
     def add_sub_recursion(self) -> Self:
@@ -237,7 +284,9 @@ class Phrase:
         **Note**
             If ``start`` returns a ``MaskToken``, sub-/suffix-phrases are **NOT** evaluated.
         """
+        self.__own__()
         self.__sub_phrases__.add(self)
+        self.__freeze__()
         return self
 
     @overload
@@ -264,12 +313,14 @@ class Phrase:
         **Note**
             If ``start`` returns a ``MaskToken``, sub-/suffix-phrases are **NOT** evaluated.
         """
+        self.__own__()
         for node in nodes:
             if isinstance(node, Phrase):
                 self.__suffix_phrases__.add(node)
             else:
                 for _node in node:
                     self.__suffix_phrases__.add(_node)
+        self.__freeze__()
         return self
 
     def add_suffix_recursion(self) -> Self:
@@ -278,12 +329,16 @@ class Phrase:
         **Note**
             If ``start`` returns a ``MaskToken``, sub-/suffix-phrases are **NOT** evaluated.
         """
+        self.__own__()
         self.__suffix_phrases__.add(self)
+        self.__freeze__()
         return self
 
     def rm_sub_recursion(self) -> Self:
         """Remove the phrase from its own sub-phrases."""
+        self.__own__()
         self.__sub_phrases__.discard(self)
+        self.__freeze__()
         return self
 
     @overload
@@ -296,17 +351,21 @@ class Phrase:
 
     def rm_suffixes(self, *nodes: Phrase | Iterable[Phrase]) -> Self:
         """Remove one or more suffix phrases from the current phrase."""
+        self.__own__()
         for node in nodes:
             if isinstance(node, Phrase):
                 self.__suffix_phrases__.discard(node)
             else:
                 for _node in node:
                     self.__suffix_phrases__.discard(_node)
+        self.__freeze__()
         return self
 
     def rm_suffix_recursion(self) -> Self:
         """Remove the phrase from its own suffix-phrases."""
+        self.__own__()
         self.__suffix_phrases__.discard(self)
+        self.__freeze__()
         return self
 
     def atStart(self, node: tokens.T_START_TOKENS):
@@ -320,11 +379,16 @@ class Phrase:
         """
 
 
+Phrase.__init_keys__ = _init_keys(Phrase)
+
+
 class Root:
     """Represents the structure configuration root and parsing entry.
     All phrase configurations must be attached to this.
     """
 
+    __slots__ = ("__dict__", "__sub_phrases__", "__suffix_phrases__", "__subs__", "__suffixes__", "__shared__")
+
     id: Any
     """[*ENTRY*] phrase id (default usage: only for debugging)"""
 
@@ -346,13 +410,30 @@ class Root:
     """[*ENTRY*] index class"""
 
     __sub_phrases__: set[Phrase]
+    __subs__: tuple[Phrase, ...]
+    """[*internal*] snapshot of the sub-phrases iterated by the parser"""
+
+    __default_tokenize__: bool = True
+    """[*internal*] whether ``tokenize`` is not defined by the class (evaluated once per class)"""
+
+    __init_keys__: frozenset[str]
+    """[*internal*] keyword arguments accepted by ``__init__`` (evaluated once per class)"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__default_tokenize__ = cls.tokenize is Root.tokenize
+        cls.__init_keys__ = _init_keys(cls)
 
     def __init__(self, *args, **kwargs):
+        # also replaces the tokenize stream if tokenize has not been defined
         Phrase.__init__(self, *args, **kwargs)  # type: ignore
-        if self.__class__.tokenize is Root.tokenize:
-            # saves some operations in the parsing process
-            # if tokenize has not been defined
-            self.TTokenizeStream = self.TDefaultTokenizeStream
+
+    trigger: None = None
+    """[*internal*] fake interface for duck-typing"""
+    literal_trigger: None = None
+    """[*internal*] fake interface for duck-typing"""
+    __trigger__: None = None
+    """[*internal*] fake interface for duck-typing"""
 
     starts: None
     """[*internal*] fake interface for duck-typing (cannot be overridden)"""
@@ -397,10 +478,13 @@ class Root:
         """
         return Phrase.rm_subs(self, *nodes)  # type: ignore
 
-    def parse_rows(self, rows: list[str]) -> tokens.RootNode:
-        """Parses the given list of row strings and generates a Root object,
+    def parse_rows(self, rows: Iterable[str]) -> tokens.RootNode:
+        """Parses the given row strings and generates a Root object,
         which represents the hierarchical structure derived from the rows.
 
+        The rows are consumed lazily, one by one, during the parsing process;
+        any iterable can be passed (e.g. a list, a generator or an opened text file).
+
         **Note**
             Line breaks (``\\n \\r\\n``) are **NOT** interpreted automatically
             and must be present in the data if they are to be parsed.
@@ -408,6 +492,7 @@ class Root:
         entry = self.TRootNode(self)
         self.TParser(doc=rows, entry=entry).__run__()
         entry.end = self.TEOFToken(entry)
+        entry.__version__ = 0
         return entry
 
     def parse_string(self, string: str) -> tokens.RootNode:
@@ -415,3 +500,5 @@ class Root:
         """
         return self.parse_rows(string.splitlines(keepends=True))
 
+
+Root.__init_keys__ = _init_keys(Root)
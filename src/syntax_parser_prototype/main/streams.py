@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from collections import deque
-from io import StringIO
-from typing import TYPE_CHECKING, Pattern, Callable, Literal, Iterable, Any
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Pattern, Callable, Literal, Iterable, Iterator, Any
 
 if TYPE_CHECKING:
     from . import phrase
@@ -20,6 +20,18 @@ __all__ = (
 )
 
 
+@lru_cache(maxsize=256)
+def _pattern(regex: str) -> Pattern[str]:
+    """compiled pattern of a string passed to ``TokenizeStream.eat_until`` or ``TokenizeStream.eat_while_match``"""
+    return re.compile(regex)
+
+
+@lru_cache(maxsize=256)
+def _charset_pattern(charset: str | frozenset[str]) -> Pattern[str]:
+    """compiled character class of ``TokenizeStream.eat_while_in``"""
+    return re.compile("[" + "".join(re.escape(c) for c in charset) + "]*" if charset else "")
+
+
 class TokenizeStream:
     r"""Tokenizer stream is a sub-stream that is passed to the ``Phrase.tokenize`` method (if defined)
     and allows the dedicated tokenization of the designated part of a row.
@@ -28,7 +40,7 @@ class TokenizeStream:
 
     :ivar delimiter: Delimiter token that defines the end of the designated content or None for the row end.
     :type delimiter: NodeToken | EndToken | Token | None
-    :ivar designated: The content of the part of the row intended for tokenization.
+    :ivar designated: `<property>` The content of the part of the row intended for tokenization.
     :type designated: str
     :ivar i: Counter that tracks the number of tokenization calls in the stream.
     :type i: int
@@ -43,28 +55,37 @@ class TokenizeStream:
     :type parsed: str
     :ivar eat_n: `<method>` advance the stream by `n` characters of the unparsed content and return them.
     :ivar eat_remain: `<method>` advance the stream to the end and return the rest of the unparsed content.
-    :ivar eat_until: `<method>` advance the stream to the beginning of the matching `regex` in the unparsed
+    :ivar eat_until: `<method>` advance the stream to the beginning of the matching `regex` (a compiled pattern
+        or a pattern string, compiled once and cached) in the unparsed
         part and return this advanced content (exclusive matching content);
         or consume and return the rest of the unparsed content if no match was found and `strict` is ``False`` (default),
         otherwise ``None``
     :ivar eat_while: `<method>` commit character by character from the unparsed content and advance the stream as long as the function call returns a truth value, then return the sum.
+    :ivar eat_while_match: `<method>` advance the stream by the content that `regex` matches at the beginning of the
+        unparsed part and return it (an empty string if it does not match); the character scan runs in the regex engine.
+    :ivar eat_while_in: `<method>` advance the stream as long as the characters of the unparsed content are in `charset`, then return the sum.
     """
 
     __stream__: Stream
     """main stream object"""
     __at__: int
     """start point of the current token in the designated part"""
-    __buffer__: StringIO
+    __buffer__: list[str]
     """buffer for current token content"""
     __cursor__: int
     """current cursor position in the designated part"""
     __feat_token__: tokens.T_BASE_TOKENS
     """the token that triggers tokenization (special interface for features)"""
-
+    __row__: str
+    """the row of the main stream"""
+    __start__: int
+    """starting point of the designated part in the row"""
+    __end__: int
+    """ending point of the designated part in the row"""
+    __designated__: str | None
+    """the designated content once sliced"""
     delimiter: tokens.T_BASE_TOKENS | None | tokenize.RTokenize
     """which delimits the designated content (None for row end)"""
-    designated: str
-    """the designated content"""
     i: int
     """iteration counter"""
     context: Literal["<", "i", ">"]
@@ -88,78 +109,130 @@ class TokenizeStream:
         self.context = context
         self.__at__ = -1
         self.__cursor__ = 0
-        self.designated = self.__stream__.row[
-            slice(
-                self.__stream__.__position__,
-                self.delimiter.column_start if self.delimiter else None
-            )
-        ]
+        self.__row__ = stream.row
+        # the designated part is only held as indices of the row,
+        # the content is sliced when it is actually consumed
+        self.__start__, self.__end__, _ = slice(
+            stream.__position__,
+            delimiter.column_start if delimiter else None
+        ).indices(stream.__len_row__)
+        if self.__end__ < self.__start__:
+            self.__end__ = self.__start__
+        self.__designated__ = None
+
+    @property
+    def designated(self) -> str:
+        """the designated content"""
+        if self.__designated__ is None:
+            self.__designated__ = self.__row__[self.__start__:self.__end__]
+        return self.__designated__
 
     @property
     def unparsed(self) -> str:
         """look up unparsed part of the designated content"""
-        return self.designated[self.__cursor__:]
+        return self.__row__[self.__start__ + self.__cursor__:self.__end__]
 
     @property
     def parsed(self) -> str:
         """parsed part of the designated content"""
-        return self.designated[:self.__cursor__]
+        return self.__row__[self.__start__:min(self.__start__ + self.__cursor__, self.__end__)]
 
     def eat_n(self, n: int = 1) -> str:
         """advance the stream by `n` characters of the unparsed content and return them"""
-        self.__buffer__.write(c := self.designated[self.__cursor__:self.__cursor__ + n])
+        pos = self.__start__ + self.__cursor__
+        self.__buffer__.append(c := self.__row__[pos:min(pos + n, self.__end__)])
         self.__cursor__ += n
         return c
 
     def eat_remain(self) -> str:
         """advance the stream to the end and return the rest of the unparsed content"""
-        self.__buffer__.write(c := self.designated[self.__cursor__:])
-        self.__cursor__ = len(self.designated)
+        start = self.__start__
+        end = self.__end__
+        self.__buffer__.append(c := self.__row__[start + self.__cursor__:end])
+        self.__cursor__ = end - start
         return c
 
-    def eat_until(self, regex: Pattern[str], strict: bool = False) -> str | None:
+    def eat_until(self, regex: Pattern[str] | str, strict: bool = False) -> str | None:
         """advance the stream to the beginning of the matching `regex` in the unparsed
         part and return this advanced content (exclusive matching content);
         or consume and return the rest of the unparsed content if no match was found and `strict` is ``False`` (default),
         otherwise ``None``
+
+        The pattern is applied to a slice of the unparsed part (``Pattern.search(unparsed)``),
+        so ``^`` matches at the beginning of the unparsed part and lookbehinds do not see the parsed part
+        (unlike ``eat_while_match``).
+        A pattern string is compiled once and then taken from the cache.
         """
-        if m := regex.search(self.unparsed):
-            self.__buffer__.write(c := self.unparsed[:m.start()])
-            self.__cursor__ += m.start()
+        if isinstance(regex, str):
+            regex = _pattern(regex)
+        if m := regex.search(unparsed := self.unparsed):
+            self.__buffer__.append(c := unparsed[:(n := m.start())])
+            self.__cursor__ += n
             return c
         elif strict:
             return None
         else:
-            return self.eat_remain()
+            self.__buffer__.append(unparsed)
+            self.__cursor__ = self.__end__ - self.__start__
+            return unparsed
 
     def eat_while(self, f: Callable[[str], bool | Any]) -> str:
         """commit character by character from the unparsed content and advance the stream
         as long as the function call returns a truth value, then return the sum
         """
-        buffer = StringIO()
-        while self.unparsed and f(self.unparsed[0]):
-            buffer.write(self.eat_n(1))
-        return buffer.getvalue()
-
-    def __istart__(self):
-        if self.unparsed:
-            if self.__at__ == self.__cursor__:
-                raise TokenizationAdvanceError(self)
-            self.__buffer__ = StringIO()
-            return True
+        row = self.__row__
+        end = self.__end__
+        i = start = self.__start__ + self.__cursor__
+        while i < end and f(row[i]):
+            i += 1
+        self.__buffer__.append(c := row[start:i])
+        self.__cursor__ += i - start
+        return c
+
+    def eat_while_match(self, regex: Pattern[str] | str) -> str:
+        """advance the stream by the content that `regex` matches at the beginning of the unparsed part
+        and return it (an empty string if it does not match)
+
+        The pattern is applied in place to the row (``Pattern.match(row, pos, endpos)``),
+        so ``^`` does not match at the beginning of the unparsed part and lookbehinds see the parsed part.
+        A pattern string is compiled once and then taken from the cache.
+        """
+        if isinstance(regex, str):
+            regex = _pattern(regex)
+        start = self.__start__ + self.__cursor__
+        if m := regex.match(self.__row__, start, self.__end__):
+            self.__buffer__.append(c := m.group())
+            self.__cursor__ += m.end() - start
+            return c
         else:
-            return False
+            return ""
+
+    def eat_while_in(self, charset: str | Iterable[str]) -> str:
+        """advance the stream as long as the characters of the unparsed content are in `charset`,
+        then return the sum (the membership test is compiled into a character class and cached per charset)
+        """
+        if not isinstance(charset, str):
+            charset = frozenset(charset)
+        return self.eat_while_match(_charset_pattern(charset))
 
     def __run__(self):
-        node = self.__stream__.node
+        inner = self.__stream__.node.inner
+        append = inner.append
         tokenize = self.__feat_token__.__feat_phrase__.tokenize
+        length = self.__end__ - self.__start__
+        buffer = self.__buffer__ = []
         self.i = 0
-        while self.__istart__():
-            self.__at__ = self.__cursor__
-            node.inner.append(tokenize(self)(
-                at=self.__at__,
+        while (at := self.__cursor__) < length:
+            if self.__at__ == at:
+                raise TokenizationAdvanceError(self)
+            buffer.clear()
+            self.__at__ = at
+            token = tokenize(self)(
+                at=at,
                 to=-00,
-            ).__ini_from_tokenize__(self.__buffer__.getvalue(), self))
+            ).__ini_from_tokenize__("".join(buffer), self)
+            token.__idx__ = len(inner)
+            append(token)
             self.i += 1
 
 
@@ -168,12 +241,13 @@ class DefaultTokenizeStream(TokenizeStream):
     ``Phrase.TDefaultToken`` (saves operations if ``Phrase.tokenize`` is not defined)"""
 
     def __run__(self):
-        self.__stream__.node.inner.append(
-            self.__feat_token__.__feat_phrase__.TDefaultToken(
-                at=0,
-                to=-1,
-            ).__ini_from_tokenize__(self.designated, self)
-        )
+        inner = self.__stream__.node.inner
+        token = self.__feat_token__.__feat_phrase__.TDefaultToken(
+            at=0,
+            to=-1,
+        ).__ini_from_tokenize__(self.__row__[self.__start__:self.__end__], self)
+        token.__idx__ = len(inner)
+        inner.append(token)
 
 
 class Stream:
@@ -183,8 +257,8 @@ class Stream:
 
     :ivar row: The current row being parsed.
     :type row: str
-    :ivar buffer: Remaining unparsed rows stored in a deque.
-    :type buffer: deque[str]
+    :ivar buffer: Iterator over the remaining unparsed rows (consumed lazily).
+    :type buffer: Iterator[str]
     :ivar node: The currently active node in the parsing process.
     :type node: NodeToken
     :ivar row_no: Counter for rows processed.
@@ -199,7 +273,7 @@ class Stream:
 
     row: str
     """current row to parse"""
-    buffer: deque[str]
+    buffer: Iterator[str]
     """remain unparsed rows"""
     node: tokens.NodeToken
     """current active node"""
@@ -210,11 +284,21 @@ class Stream:
 
     __position__: int
     """usually reflects viewpoint, only acts as a separate data anchor in a masking area"""
+    __len_row__: int
+    """length of the current row"""
+    __unparsed__: str
+    """cached unparsed part of the current row"""
+    __unparsed_at__: int = -1
+    """viewpoint of the cached unparsed part (-1 if outdated)"""
 
     @property
     def unparsed(self) -> str:
         """remain unparsed part of the current row"""
-        return self.row[self.viewpoint:]
+        if self.__unparsed_at__ != self.viewpoint:
+            # shared by all phrase queries at the same viewpoint
+            self.__unparsed__ = self.row[self.viewpoint:]
+            self.__unparsed_at__ = self.viewpoint
+        return self.__unparsed__
 
     @property
     def parsed(self) -> str:
@@ -228,8 +312,10 @@ class Parser(Stream):
     root: tokens.RootNode
     """the root node"""
 
-    __suffix_phrases__: set[phrase.Phrase] | None
+    __suffix_phrases__: tuple[phrase.Phrase, ...] | None
     """suffix phrases to be searched for"""
+    __triggers__: dict[phrase.Phrase, tuple[int, int]]
+    """(row number, position of the next occurrence or -1) of the phrase triggers"""
 
     def __init__(
             self,
@@ -239,60 +325,61 @@ class Parser(Stream):
             row_no: int = 0,
             viewpoint: int = 0,
             __position__: int = 0,
-            __suffix_phrases__: set[phrase.Phrase] | None = None,
+            __suffix_phrases__: tuple[phrase.Phrase, ...] | None = None,
     ):
         self.row = row
-        self.buffer = deque(doc)
+        self.__len_row__ = len(row)
+        self.buffer = iter(doc)
         self.entry = self.node = entry
         self.root = entry.root
         self.row_no = row_no
         self.viewpoint = viewpoint
         self.__position__ = __position__
         self.__suffix_phrases__ = __suffix_phrases__
+        self.__triggers__ = dict()
 
     def __nextrow__(self):
         """move to the next row"""
         try:
-            self.row = self.buffer.popleft()
+            self.row = next(self.buffer)
             self.root.tokenIndex.__at_row__(self)
-        except IndexError:
+        except StopIteration:
             raise EOFError
         else:
+            self.__len_row__ = len(self.row)
+            self.__unparsed_at__ = -1
             self.row_no += 1
             self.viewpoint = self.__position__ = 0
 
     def __carry__(self, n: int):
-        """advance viewpoint and __pos__ by n"""
-        self.viewpoint = self.__position__ = self.viewpoint + n
+        """advance viewpoint and __position__ by n
 
-    # def __carby__(self, item: tokens.T_START_TOKENS):
-    #     """advance viewpoint and __pos__ to the end of a parsed token"""
-    #     self.__carry__(item.__to__)
-    #     if self.viewpoint >= len(self.row):
-    #         self.__nextrow__()
+        (wrapper for external callers; the parsing process advances in place and does not call it)
+        """
+        self.viewpoint = self.__position__ = self.viewpoint + n
 
     def __mask_continue__(self) -> tokens.T_BASE_TOKENS:
         """search for a mask continuation, otherwise return the found non-mask token"""
-        active_stop = self.node.__ends__(self)
-
-        item: tokens.Token | tokens.MaskToken | tokens.MaskNodeToken
-        if item := self.__search_sub__():
-            if active_stop and active_stop < item:
+        while True:
+            active_stop = self.node.__ends__(self)
+
+            item: tokens.Token | tokens.MaskToken | tokens.MaskNodeToken
+            if item := self.__search_sub__():
+                if active_stop and active_stop < item:
+                    return active_stop
+                elif not item.__fMASK__:
+                    return item
+                else:
+                    item: tokens.MaskToken | tokens.MaskNodeToken
+                    item.__ini_as_node__(self)
+                    self.__adv_mask__(item)
+            elif active_stop:
                 return active_stop
-            elif not item.__fMASK__:
-                return item
             else:
-                item: tokens.MaskToken | tokens.MaskNodeToken
-                item.__ini_as_node__(self)
-                return self.__adv_mask__(item)
-        elif active_stop:
-            return active_stop
-        else:
-            self.node.phrase.TTokenizeStream(self, None, self.node).__run__()
-            self.__nextrow__()
-            return self.__mask_continue__()
+                self.node.phrase.TTokenizeStream(self, None, self.node).__run__()
+                self.__nextrow__()
 
-    def __adv_mask__(self, mask: tokens.MaskToken | tokens.MaskNodeToken) -> tokens.T_BASE_TOKENS:
+    def __adv_mask__(self, mask: tokens.MaskToken | tokens.MaskNodeToken) -> None:
         """process a mask token"""
 
         if mask.__to__ == 0:
@@ -300,7 +387,7 @@ class Parser(Stream):
 
         self.viewpoint += mask.__to__
 
-        if self.viewpoint >= len(self.row):
+        if self.viewpoint >= self.__len_row__:
             self.node.phrase.TTokenizeStream(self, None, self.node).__run__()
             self.__nextrow__()
 
@@ -311,11 +398,10 @@ class Parser(Stream):
             e.__ini_as_token__(self)
             self.viewpoint += e.__to__
 
-        return self.__mask_continue__()
-
     def __masking__(self, mask: tokens.MaskToken | tokens.MaskNodeToken) -> None:
         """masking entry point"""
-        end = self.__adv_mask__(mask)
+        self.__adv_mask__(mask)
+        end = self.__mask_continue__()
         end.__viewpoint__ = self.viewpoint
         self.node.phrase.TTokenizeStream(self, end, self.node).__run__()
         self.viewpoint = self.__position__ = self.viewpoint + end.__at__
@@ -332,7 +418,8 @@ class Parser(Stream):
         else:
             if item.__at__:
                 # remain token
-                self.node.phrase.TTokenizeStream(self, item, self.node).__run__()
+                node = self.node
+                node.phrase.TTokenizeStream(self, item, node).__run__()
             item.__featurize__(self)
 
     def __adv_sub__(self, item: tokens.T_START_TOKENS) -> None:
@@ -350,18 +437,44 @@ class Parser(Stream):
         end.__ini_as_token__(self)
         if end.__at__:
             # remain token
-            self.node.phrase.TTokenizeStream(self, end, self.node).__run__()
+            node = self.node
+            node.phrase.TTokenizeStream(self, end, node).__run__()
         end.__featurize__(self)
 
-    def __search_phrase__(self, phrases: set[phrase.Phrase]) -> tokens.T_START_TOKENS | None:
+    def __triggered__(self, ph: phrase.Phrase) -> bool:
+        """whether the trigger of the phrase occurs in the unparsed part of the row"""
+        viewpoint = self.viewpoint
+        if (known := self.__triggers__.get(ph)) and known[0] == self.row_no:
+            if (at := known[1]) < 0:
+                # no further occurrence in this row
+                return False
+            elif at >= viewpoint:
+                return True
+        m = ph.__trigger__.search(self.unparsed)
+        self.__triggers__[ph] = (self.row_no, viewpoint + m.start() if m else -1)
+        return m is not None
+
+    def __starts__(self, ph: phrase.Phrase) -> tokens.T_START_TOKENS | None:
+        """query the start of the phrase (skipped if its trigger does not occur in the unparsed part of the row)"""
+        if (ph.__trigger__ is None or self.__triggered__(ph)) and (item := ph.starts(self)):
+            item.phrase = ph
+            return item
+        return None
+
+    def __search_phrase__(self, phrases: tuple[phrase.Phrase, ...]) -> tokens.T_START_TOKENS | None:
+        if len(phrases) < 2:
+            # shortcut for phrases with none or a single sub-/suffix-phrase
+            # (no priority comparison required)
+            if phrases:
+                return self.__starts__(phrases[0])
+            return None
+
         item: tokens.T_START_TOKENS | None = None
         __iter__ = iter(phrases)
 
         try:
             while item is None:
-                ph = next(__iter__)
-                if _itm := ph.starts(self):
-                    _itm.phrase = ph
+                if _itm := self.__starts__(next(__iter__)):
                     if _itm.__fINSTANT__:
                         return _itm
                     else:
@@ -373,8 +486,7 @@ class Parser(Stream):
         # a start found
         # search in the rest of the phrases and compare priority
         for ph in __iter__:
-            if _itm := ph.starts(self):
-                _itm.phrase = ph
+            if _itm := self.__starts__(ph):
                 if _itm.__fINSTANT__:
                     return _itm
                 elif _itm < item:
@@ -386,47 +498,56 @@ class Parser(Stream):
         """search for suffix phrase"""
         if phrases := self.__suffix_phrases__:
             self.__suffix_phrases__ = None
-            if (item := self.__search_phrase__(phrases)) and item.__at__ == 0:
-                return item
+            # only a start at the viewpoint is valid,
+            # others do not need to be compared
+            item: tokens.T_START_TOKENS | None = None
+            for ph in phrases:
+                if _itm := self.__starts__(ph):
+                    if _itm.__fINSTANT__:
+                        return None if _itm.__at__ else _itm
+                    elif not _itm.__at__ and (item is None or _itm < item):
+                        item = _itm
+            return item
         return None
 
     def __search_sub__(self) -> tokens.T_START_TOKENS | None:
         """search for sub phrase"""
-        return self.__search_phrase__(self.node.phrase.__sub_phrases__)
+        return self.__search_phrase__(self.node.phrase.__subs__)
 
     def __iteration__(self) -> None:
         """main iteration"""
-        end = self.node.__ends__(self)
+        node = self.node
+        end = node.__ends__(self)
 
         if end and end.__fINSTANT__:
             self.__adv_end__(end)
-        else:
-            if suffix_item := self.__search_suffix__():
-                self.__adv_sub__(suffix_item)
-            elif sub_item := self.__search_sub__():
-                if sub_item.__fINSTANT__:
-                    self.__adv_sub__(sub_item)
-                elif end and end < sub_item:
-                    self.__adv_end__(end)
-                else:
-                    self.__adv_sub__(sub_item)
-            elif end:
+        elif self.__suffix_phrases__ and (item := self.__search_suffix__()):
+            self.__adv_sub__(item)
+        elif item := self.__search_sub__():
+            if end and not item.__fINSTANT__ and end < item:
                 self.__adv_end__(end)
             else:
-                self.node.phrase.TTokenizeStream(self, None, self.node).__run__()
-                self.__nextrow__()
+                self.__adv_sub__(item)
+        elif end:
+            self.__adv_end__(end)
+        else:
+            node.phrase.TTokenizeStream(self, None, node).__run__()
+            self.__nextrow__()
 
     def __run__(self) -> None:
         try:
             if not self.row:
                 try:
-                    self.row = self.buffer.popleft()
-                except IndexError:
+                    self.row = next(self.buffer)
+                except StopIteration:
                     raise EOFError
+                self.__len_row__ = len(self.row)
+                self.__unparsed_at__ = -1
                 self.root.tokenIndex.__at_row__(self)
             else:
                 self.root.tokenIndex.__at_stale__(self)
+            iteration = self.__iteration__
             while True:
-                self.__iteration__()
+                iteration()
         except EOFError:
             self.root.tokenIndex.__build__()
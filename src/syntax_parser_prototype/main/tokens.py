@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Union, Iterator
 
-from xpropcache import PropCache
-
 if TYPE_CHECKING:
     from typing import Self
     from . import streams, phrase
@@ -47,6 +45,9 @@ class Token:
         end, or standalone token that significantly influence the parsing process (see the module documentation of ``syntax_parser_prototype.features`` for more information).
     """
 
+    __slots__ = ("__viewpoint__", "__at__", "__to__", "__content__", "node", "row_no", "phrase",
+                 "__features__", "__reader__", "__idx__")
+
     id = "T"
     """[*ENTRY*] token id (default usage: only for debugging)"""
 
@@ -57,13 +58,13 @@ class Token:
     __to__: int
     """[*internal*] ending point of the token relative to the viewpoint"""
 
-    content: str = ''
-    """content of the token"""
+    __content__: str
+    """[*internal*] content of the token (written directly during the parsing process)"""
     node: NodeToken
     """source node of the token"""
     row_no: int
     """row number where the token is located (starting from 0)"""
-    phrase: phrase.Phrase | None = None  # set by stream in nodes or stand-alone-tokens
+    phrase: phrase.Phrase | None  # set by stream in nodes or stand-alone-tokens
     """source phrase (only set in nodes or stand-alone-tokens)"""
 
     # @formatter:off
@@ -74,14 +75,51 @@ class Token:
     __fMASK__       : bool = False
     # @formatter:on
 
+    __kind__: int = 0
+    """[*internal*] type index derived from the flags (0: token, 1: node, 2: end)"""
+    __base_feat__: tokenize._BaseFeat = tokenize.BASE_T_FEAT
+    """[*internal*] base feature of the type (by ``__kind__``)"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__kind__ = 2 if cls.__fEND__ else 1 if cls.__fNODE__ else 0
+        cls.__base_feat__ = tokenize.BaseFeat(cls)
+
     __generators__: readers.__TokenGenerators__ = readers.__TokenGenerators__()
 
+    __reader__: readers.TokenReader | None
+    """[*internal*] default reader of the token, created with the first access of ``tokenReader``"""
+
+    __idx__: int
+    """[*internal*] index in ``node.inner``, recorded when the token is appended (verified by ``inner_index``)"""
+
     @property
     def tokenReader(self) -> readers.TokenReader:
         """Provides functionality to iterate through tokens in a one-dimensional
         context and other structure-related methods.
         """
-        return readers.TokenReader.__default__(self)
+        if (reader := self.__reader__) is None:
+            self.__reader__ = reader = readers.TokenReader.__default__(self)
+        return reader
+
+    @property
+    def content(self) -> str:
+        """content of the token"""
+        return self.__content__
+
+    @content.setter
+    def content(self, content: str) -> None:
+        resized = len(content) != len(self.__content__)
+        self.__content__ = content
+        if (node := getattr(self, "node", None)) is not None and (root := node.root).__version__ is not None:
+            # invalidates the content caches of the readers
+            root.__version__ += 1
+            if resized:
+                root.tokenIndex.__data_cache_reset__()
+                node.__len_inner__ = None
+                while node is not node.node:
+                    node = node.node
+                    node.__len_inner__ = None
 
     __features__: tokenize.T_STD_FEATURES
 
@@ -102,6 +140,10 @@ class Token:
         self.__at__ = at
         self.__to__ = to
         self.__features__ = features
+        self.__content__ = ''
+        self.phrase = None
+        self.__reader__ = None
+        self.__idx__ = -1
 
     @property
     def __designated__(self) -> int:
@@ -114,11 +156,11 @@ class Token:
         If several tokens are in the same position and one of them has no content,
         this token is prioritized (null token); otherwise, the longest token (``__designated__``) has priority.
         """
-        if self.__at__ != other.__at__:
-            return self.__at__ < other.__at__
+        if (at := self.__at__) != (other_at := other.__at__):
+            return at < other_at
         else:
-            designated = self.__designated__
-            return not designated or designated > other.__designated__
+            designated = self.__to__ - at
+            return not designated or designated > other.__to__ - other_at
 
     @property
     def column_start(self) -> int:
@@ -148,7 +190,11 @@ class Token:
     @property
     def inner_index(self) -> int:
         """index of the token in its parent node"""
-        return self.node.inner.index(self)
+        inner = self.node.inner
+        if 0 <= (i := self.__idx__) < len(inner) and inner[i] is self:
+            return i
+        self.__idx__ = i = inner.index(self)
+        return i
 
     @property
     def previous(self) -> T_RESULT_TOKEN:
@@ -173,12 +219,13 @@ class Token:
 
         The new content should be valid for the token; it is neither checked nor parsed.
         """
-        if reindex and (diff := len(content) - self.len_token):
-            for t in self.tokenReader.thereafter:
-                if t.row_no != self.row_no:
-                    break
-                t.__viewpoint__ += diff
-            self.node.root.tokenIndex.__char_cache_reset__(self.row_no)
+        if diff := len(content) - self.len_token:
+            if reindex:
+                for t in self.tokenReader.thereafter:
+                    if t.row_no != self.row_no:
+                        break
+                    t.__viewpoint__ += diff
+                self.node.root.tokenIndex.__char_cache_reset__(self.row_no)
         self.content = content
 
     def __str__(self) -> str:
@@ -233,7 +280,7 @@ class Token:
 
     def __ini_from_tokenize__(self, content: str, stream: streams.TokenizeStream) -> Self:
         """[*internal*] late bindings for plain tokens"""
-        self.content = content
+        self.__content__ = content
         self.__to__ = self.__at__ + len(content)
         return self.__ini_as_token__(stream.__stream__)
 
@@ -259,6 +306,8 @@ class NodeToken(Token):
     :param extras: Dynamic additional information about the node.
     """
 
+    __slots__ = ("inner", "end", "extras", "root", "__inner_nodes__", "__len_inner__")
+
     id = "N"
     """[*ENTRY*] token id (default usage: only for debugging)"""
     phrase: phrase.Phrase
@@ -267,6 +316,11 @@ class NodeToken(Token):
     """tokens of the phrase (excl. this node and the end token, can contain sub- or suffix-branches)"""
     end: EndToken | OpenEndToken
     """end token of the phrase"""
+    root: RootNode
+    """root node of the tree"""
+
+    __inner_nodes__: bool
+    """[*internal*] whether ``inner`` contains node tokens (set when a node is appended)"""
 
     class NodeExtras(dict):
         """dict-like with __getattr__ and __setattr__"""
@@ -292,7 +346,9 @@ class NodeToken(Token):
         """Provides functionality to iterate through tokens in a one-dimensional
         context and other structure-related methods.
         """
-        return readers.NodeTokenReader.__default__(self)
+        if (reader := self.__reader__) is None:
+            self.__reader__ = reader = readers.NodeTokenReader.__default__(self)
+        return reader
 
     __features__: tokenize.T_NODE_FEATURES
 
@@ -313,16 +369,19 @@ class NodeToken(Token):
     ):
         Token.__init__(self, at, to, features)
         self.extras = extras  # type: ignore
+        self.__len_inner__ = None
 
-    @PropCache.cached_property
-    def root(self) -> RootNode:
-        """root node of the tree"""
-        return self.node.root
+    __len_inner__: int | None
+    """[*internal*] cached ``len_inner`` (only set when the parsing process is finished)"""
 
     @property
     def len_inner(self) -> int:
         """length of all content within this branch (incl. subbranches, excl. this node and the end token)"""
-        return sum(t.len_token for t in self.tokenReader.inner)
+        if (n := self.__len_inner__) is None:
+            n = sum(t.len_token for t in self.tokenReader.inner)
+            if self.root.__version__ is not None:
+                self.__len_inner__ = n
+        return n
 
     @property
     def len_branch(self) -> int:
@@ -364,8 +423,10 @@ class NodeToken(Token):
 
     def __ini__(self, node: NodeToken, row_no: int, viewpoint: int) -> Self:
         self.inner = list()
+        self.__inner_nodes__ = False
         self.end = self.phrase.TOpenEndToken(self)
         self.extras = self.NodeExtras(self.extras)
+        self.root = self if node is self else node.root
         return super().__ini__(node, row_no, viewpoint)
 
     def __ini_as_token__(self, stream: streams.Stream) -> Self:
@@ -393,6 +454,8 @@ class EndToken(Token):
         end, or standalone token that significantly influence the parsing process (see the module documentation of ``syntax_parser_prototype.features`` for more information).
     """
 
+    __slots__ = ()
+
     id = "E"
     """[*ENTRY*] token id (default usage: only for debugging)"""
     phrase: None
@@ -440,6 +503,8 @@ class OpenEndToken(Token):
     Acts as an interface to the last seen token of the phrase for duck typing.
     """
 
+    __slots__ = ()
+
     id = "O"
     __fEND__: bool = True
     __generators__: readers.__OpenEndTokenGenerators__ = readers.__OpenEndTokenGenerators__()
@@ -461,8 +526,10 @@ class OpenEndToken(Token):
         return self.last_token.row_no
 
     def __init__(self, node: NodeToken):  # noqa: super-init-not-called
-        self.content = ""
+        self.__content__ = ""
         self.node = node
+        self.phrase = None
+        self.__reader__ = None
 
     @property
     def last_token(self) -> T_INNER_TOKEN:
@@ -509,6 +576,8 @@ class MaskToken(Token):
         -- **including the part processed by a custom feature configuration**.
     """
 
+    __slots__ = ()
+
     id = "?"  # never present in the result
     __fMASK__: bool = True
 
@@ -531,6 +600,8 @@ class MaskNodeToken(MaskToken, NodeToken):
         -- **including the part processed by a custom feature configuration**.
     """
 
+    __slots__ = ()
+
     id = "?N"  # never present in the result
 
     def __init__(self, at: int, to: int):
@@ -550,6 +621,8 @@ class InstantToken(Token):
         end, or standalone token that significantly influence the parsing process (see the module documentation of ``syntax_parser_prototype.features`` for more information).
     """
 
+    __slots__ = ()
+
     id = "i"
     """[*ENTRY*] token id (default usage: only for debugging)"""
     __fINSTANT__: bool = True
@@ -574,6 +647,8 @@ class InstantEndToken(EndToken, InstantToken):
         end, or standalone token that significantly influence the parsing process (see the module documentation of ``syntax_parser_prototype.features`` for more information).
     """
 
+    __slots__ = ()
+
     id = "iE"
     """[*ENTRY*] token id (default usage: only for debugging)"""
 
@@ -594,6 +669,8 @@ class InstantNodeToken(NodeToken, InstantToken):
         end, or standalone token that significantly influence the parsing process (see the module documentation of ``syntax_parser_prototype.features`` for more information).
     """
 
+    __slots__ = ()
+
     id = "iN"
     """[*ENTRY*] token id (default usage: only for debugging)"""
 
@@ -614,6 +691,8 @@ class DefaultEndToken(EndToken):
         end, or standalone token that significantly influence the parsing process (see the module documentation of ``syntax_parser_prototype.features`` for more information).
     """
 
+    __slots__ = ()
+
     id = "e"
     """[*ENTRY*] token id (default usage: only for debugging)"""
 
@@ -635,9 +714,11 @@ class WrapNodeToken(NodeToken):
     :param phrase: the phrase of the wrapped node
     """
 
+    __slots__ = ("__wrapped__",)
+
     id = "W"
     """[*ENTRY*] token id (default usage: only for debugging)"""
-    content = ""
+    content: str
     """content of the wrap is always empty"""
 
     __wrapped__: NodeToken
@@ -668,6 +749,8 @@ class OToken(Token):
     """Represents an inner token for the root phrase when no user-defined phrase is active.
     """
 
+    __slots__ = ()
+
     id = "o"
     """[*ENTRY*] token id (default usage: only for debugging)"""
 
@@ -679,6 +762,8 @@ class EOF(EndToken):
     (has no content but is a valid token to be included in the result).
     """
 
+    __slots__ = ()
+
     id = "EOF"
     """[*ENTRY*] token id (default usage: only for debugging)"""
 
@@ -702,6 +787,8 @@ class OEOF(OpenEndToken):
     (will never be included in the result).
     """
 
+    __slots__ = ()
+
     id = "OOEF"
     """[*ENTRY*] token id (default usage: only for debugging)"""
 
@@ -716,6 +803,8 @@ class RootNode(NodeToken):
     (has no content but is a valid token to represent the result root).
     """
 
+    __slots__ = ("tokenIndex", "__version__")
+
     id = "R"
     """[*ENTRY*] token id (default usage: only for debugging)"""
     phrase: phrase.Root
@@ -725,25 +814,27 @@ class RootNode(NodeToken):
     """tokens of the phrase (excl. this node and the end token, can contain sub- or suffix-branches)"""
     end: EOF | OEOF
     """end token representing the end of the parsed input"""
+    root: Self
+    """self"""
 
     tokenIndex: indices.TokenIndex | indices.NoneTokenIndex | indices.ExtensiveTokenIndex
 
+    __version__: int | None
+    """[*internal*] modification counter of the result,
+    None during the parsing process, then incremented by each content replacement"""
+
     __generators__: readers.__RootNodeGenerators__ = readers.__RootNodeGenerators__()
 
     def __init__(self, phrase: "phrase.Root"):
+        super().__init__(0, 0)
         self.phrase = phrase
         self.tokenIndex = phrase.TTokenIndex()
-        super().__init__(0, 0)
+        self.__version__ = None
         self.__ini__(self, 0, 0)
 
     def __lt__(self, other: NodeToken):
         return True  # never called in parsing
 
-    @property
-    def root(self) -> Self:
-        """returns self"""
-        return self
-
     @property
     def inner_index(self) -> None:
         """raises EOFError"""
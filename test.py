@@ -1,6 +1,11 @@
+import re
 import unittest
 
 from demos.pysyntax import config, template
+from src.syntax_parser_prototype import Root, Phrase, NodeToken, EndToken, OToken, debug
+from src.syntax_parser_prototype.debug import pretty_xml
+from src.syntax_parser_prototype.features import indices
+from src.syntax_parser_prototype.main import streams
 
 
 class MainTest(unittest.TestCase):
@@ -97,6 +102,214 @@ class MainTest(unittest.TestCase):
 
         test_new_places()
 
+    def test_content_edit(self):
+        anchor = next(iter(self.m_config.DEBUG_ANCHORS.values()))
+        self.assertEqual(self.result.tokenReader.branch.content, self.original_content)
+
+        edited_content = self.original_content[:anchor.data_start] + "ZZZZ" + self.original_content[anchor.data_end:]
+        anchor.content = "ZZZZ"
+        self.assertEqual(self.result.tokenReader.branch.content, edited_content)
+        self.assertEqual(str().join(i.content for i in self.result.tokenReader.branch), edited_content)
+
+    def test_len_inner_edit(self):
+        anchor = next(iter(self.m_config.DEBUG_ANCHORS.values()))
+        nodes = list(anchor.node.tokenReader.node_path)
+        lengths = [n.len_inner for n in nodes]
+
+        anchor.content += "QQ"
+        self.assertEqual([n.len_inner for n in nodes], [n + 2 for n in lengths])
+        for n in nodes:
+            self.assertEqual(n.len_inner, sum(t.len_token for t in n.tokenReader.inner))
+
+    def test_data_start_without_reindex(self):
+        root = self.m_config.main()
+        root.TTokenIndex = indices.TokenIndex
+        result = root.parse_string(self.original_content)
+        tokens = list(result.tokenReader.branch)
+
+        def test_data_starts():
+            cursor = 0
+            for t in tokens:
+                self.assertEqual(t.data_start, cursor)
+                cursor += t.len_token
+
+        test_data_starts()
+        anchor = next(t for t in tokens if t.content and not t.__fNODE__ and not t.__fEND__)
+        anchor.replace_content(anchor.content + "¿¿¿¿", reindex=False)
+        test_data_starts()
+
+    def test_trigger(self):
+
+        def parse(triggered: bool):
+            calls = 0
+            root = Root(id="root")
+            for phrase_type, trigger in (
+                    (self.m_config.CommentPhrase, {"literal_trigger": "#"}),
+                    (self.m_config.NumberPhrase, {"trigger": "\\d"}),
+            ):
+                phrase = phrase_type(**(trigger if triggered else {}))
+
+                def starts(stream, _starts=phrase.starts):
+                    nonlocal calls
+                    calls += 1
+                    return _starts(stream)
+
+                phrase.starts = starts
+                root.add_subs(phrase)
+            return pretty_xml(root.parse_string(self.original_content)), calls
+
+        xml, calls = parse(False)
+        triggered_xml, triggered_calls = parse(True)
+        self.assertEqual(triggered_xml, xml)
+        self.assertLess(triggered_calls, calls)
+
+    @staticmethod
+    def tokenize_rows(tokenize, *rows: str) -> list[str]:
+
+        class TokenizeRoot(Root):
+            def tokenize(self, stream):
+                tokenize(stream)
+                return OToken
+
+        return [t.content for t in TokenizeRoot().parse_rows(rows).inner]
+
+    def test_eat_while_in(self):
+        def tokenize(stream):
+            stream.eat_while_in(charset) or stream.eat_n(1)
+
+        for charset in ("ab-]^", {"a", "b", "-", "]", "^"}, frozenset("ab-]^"), ["a", "b", "-", "]", "^"]):
+            self.assertEqual(self.tokenize_rows(tokenize, "ab]-^xba", "a"), ["ab]-^", "x", "ba", "a"])
+
+        charset = " "
+        self.assertEqual(self.tokenize_rows(tokenize, "  x  "), ["  ", "x", "  "])
+        charset = ""
+        self.assertEqual(self.tokenize_rows(tokenize, "ab"), ["a", "b"])
+
+    def test_eat_until_str(self):
+        class Str(str):
+            pass
+
+        def tokenize(stream):
+            stream.eat_until(regex, strict=True) or stream.eat_n(1)
+
+        for regex in ("\\d", Str("\\d"), re.compile("\\d")):
+            self.assertEqual(self.tokenize_rows(tokenize, "ab1c2", "3"), ["ab", "1", "c", "2", "3"])
+
+    def test_eat_while_match_in_place(self):
+        def tokenize(stream):
+            stream.eat_while_match(regex) or stream.eat_n(1)
+
+        # ``^`` only matches at the beginning of the row
+        regex = "^a+"
+        self.assertEqual(self.tokenize_rows(tokenize, "aaxaa"), ["aa", "x", "a", "a"])
+        # lookbehinds see the parsed part
+        regex = "(?<=x)a+"
+        self.assertEqual(self.tokenize_rows(tokenize, "aaxaa"), ["a", "a", "x", "aa"])
+        # endpos is respected
+        regex = "a+$"
+        self.assertEqual(self.tokenize_rows(tokenize, "xaa"), ["x", "aa"])
+
+    def test_eat_until_slice(self):
+        def tokenize(stream):
+            eaten.append(stream.eat_until(regex, strict=True))
+            eaten[-1] or stream.eat_n(1)
+
+        # ``^`` matches at the beginning of the unparsed part
+        eaten, regex = [], "^a"
+        self.assertEqual(self.tokenize_rows(tokenize, "bab"), ["b", "a", "b"])
+        self.assertEqual(eaten, [None, "", None])
+        # lookbehinds do not see the parsed part
+        eaten, regex = [], "(?<=x)a"
+        self.assertEqual(self.tokenize_rows(tokenize, "xaa"), ["x", "a", "a"])
+        self.assertEqual(eaten, ["x", None, None])
+
+    def test_pretty_xml(self):
+        from xml.dom import minidom
+
+        def minidom_xml(branch, indent="\t", newline="\n"):
+            with debug.__repr__:
+                default_repr = debug.__repr__[NodeToken]
+                debug.__repr__[NodeToken] = debug.__repr__.NodeToken__repr__recursive
+            try:
+                string = repr(branch)
+            finally:
+                with debug.__repr__:
+                    debug.__repr__[NodeToken] = default_repr
+            return minidom.parseString(string).toprettyxml(indent, newline)
+
+        result = self.root.parse_string(self.original_content)
+        self.assertEqual(pretty_xml(result), minidom_xml(result))
+        self.assertEqual(pretty_xml(result, "  ", None), minidom_xml(result, "  ", ""))
+        self.assertEqual(pretty_xml(result.end), minidom_xml(result.end))
+
+        class BracketPhrase(Phrase):
+            id = "bracket"
+
+            def starts(self, stream):
+                if m := re.search("\\(", stream.unparsed):
+                    return NodeToken(m.start(), m.end())
+
+            def ends(self, stream):
+                if m := re.search("\\)", stream.unparsed):
+                    return EndToken(m.start(), m.end())
+
+        root = Root(id="root")
+        root.add_subs(BracketPhrase().add_subs(BracketPhrase()))
+
+        # empty node
+        self.assertEqual(pretty_xml(root.parse_string("")), (
+            '<?xml version="1.0" ?>\n'
+            '<R phrase="root" coord="0 0:0">\n'
+            '\t<EOF coord="0 0:0"/>\n'
+            '</R>\n'
+        ))
+        # text-only tokens (escaped content)
+        self.assertEqual(pretty_xml(root.parse_string("(a<&)")), (
+            '<?xml version="1.0" ?>\n'
+            '<R phrase="root" coord="0 0:0">\n'
+            '\t<N phrase="bracket" coord="0 0:1">\n'
+            '\t\t(\n'
+            '\t\t<T coord="0 1:4">a&lt;&amp;</T>\n'
+            '\t\t<E coord="0 4:5">)</E>\n'
+            '\t</N>\n'
+            '\t<o coord="0 5:5"/>\n'
+            '\t<EOF coord="0 5:5"/>\n'
+            '</R>\n'
+        ))
+        # nested node
+        self.assertEqual(pretty_xml(root.parse_string("((b))"), "  ", None), (
+            '<?xml version="1.0" ?>'
+            '<R phrase="root" coord="0 0:0">'
+            '  <N phrase="bracket" coord="0 0:1">'
+            '    ('
+            '    <N phrase="bracket" coord="0 1:2">'
+            '      ('
+            '      <T coord="0 2:3">b</T>'
+            '      <E coord="0 3:4">)</E>'
+            '    </N>'
+            '    <E coord="0 4:5">)</E>'
+            '  </N>'
+            '  <o coord="0 5:5"/>'
+            '  <EOF coord="0 5:5"/>'
+            '</R>'
+        ))
+    def test_carry_wrapper(self):
+        parser = streams.Parser((), self.result, "abc", viewpoint=1, __position__=1)
+        parser.__carry__(2)
+        self.assertEqual((parser.viewpoint, parser.__position__), (3, 3))
+
+        # the parsing process advances in place and does not call the wrapper
+        def __carry__(_, n):
+            raise AssertionError(n)
+
+        default_carry = streams.Parser.__carry__
+        streams.Parser.__carry__ = __carry__
+        try:
+            result = self.m_config.main().parse_string(self.original_content)
+        finally:
+            streams.Parser.__carry__ = default_carry
+        self.assertEqual(result.tokenReader.branch.content, self.original_content)
+
 
 if __name__ == '__main__':
     unittest.main()